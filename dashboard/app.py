@@ -1,11 +1,18 @@
 import os
 import sys
+import time
 
 from dotenv import load_dotenv
 
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
 from flask import Flask, jsonify, render_template, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
@@ -26,15 +33,60 @@ from src.database import (
     update_post_status,
 )
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Serialize API responses with orjson instead of the stdlib json module."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if orjson is not None:
+    app.json = ORJSONProvider(app)
 
 # Initialize DB once at startup
 init_db()
 
+# Dashboard reads change on human timescales, so repeat page loads within a
+# few seconds are served from memory. Any mutation endpoint clears the cache.
+CACHE_TTL_SECONDS = 5
+_read_cache: dict[str, tuple[float, object]] = {}
+
+
+def _cached(key, loader):
+    """Return the cached result for key, calling loader() once it has expired."""
+    now = time.monotonic()
+    hit = _read_cache.get(key)
+    if hit and now - hit[0] < CACHE_TTL_SECONDS:
+        return hit[1]
+    value = loader()
+    _read_cache[key] = (now, value)
+    return value
+
+
+def _invalidate_cache():
+    _read_cache.clear()
+
+
+# One ContentGenerator (and Anthropic HTTP client) per process, so keep-alive
+# connections to the API are reused across /api/generate requests
+_generator = None
+
+
+def _get_generator(api_key):
+    global _generator
+    if _generator is None or _generator.api_key != api_key:
+        _generator = ContentGenerator(api_key=api_key)
+    return _generator
+
 
 @app.route("/")
 def index():
-    drafts = get_drafts(limit=10)
+    drafts = _cached("drafts:10", lambda: get_drafts(limit=10))
     return render_template("index.html", drafts=drafts)
 
 
@@ -57,14 +109,14 @@ def rejected():
 
 @app.route("/source-health")
 def source_health():
-    failures = get_recent_failures(limit=50)
+    failures = _cached("failures:50", lambda: get_recent_failures(limit=50))
     return render_template("source_health.html", failures=failures)
 
 
 @app.route("/api/drafts")
 def api_drafts():
-    drafts = get_drafts(limit=10)
-    return jsonify(drafts)
+    drafts = _cached("drafts:10", lambda: get_drafts(limit=10))
+    return jsonify([dict(d) for d in drafts])
 
 
 @app.route("/api/posts/<int:post_id>/status", methods=["POST"])
@@ -74,19 +126,20 @@ def api_update_status(post_id):
     if status not in ("approved", "posted", "rejected", "draft"):
         return jsonify({"error": "Invalid status"}), 400
     update_post_status(post_id, status)
+    _invalidate_cache()
     return jsonify({"ok": True, "post_id": post_id, "status": status})
 
 
 @app.route("/candidates")
 def candidates():
-    items = get_ranked_candidates()
+    items = _cached("candidates:all", get_ranked_candidates)
     return render_template("candidates.html", candidates=items)
 
 
 @app.route("/api/candidates")
 def api_candidates():
-    items = get_ranked_candidates()
-    return jsonify(items)
+    items = _cached("candidates:all", get_ranked_candidates)
+    return jsonify([dict(c) for c in items])
 
 
 @app.route("/api/generate", methods=["POST"])
@@ -105,15 +158,16 @@ def api_generate():
 
     # Allow retry: reset error status back to generating
     update_candidate_status(candidate_id, "generating")
+    _invalidate_cache()
 
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         update_candidate_status(candidate_id, "error", error_message="ANTHROPIC_API_KEY not set")
+        _invalidate_cache()
         return jsonify({"error": "ANTHROPIC_API_KEY not configured"}), 500
 
     try:
-        generator = ContentGenerator(api_key=api_key)
-        result = generator.generate_post({
+        result = _get_generator(api_key).generate_post({
             "title": candidate.get("title", ""),
             "content": candidate.get("content", ""),
             "url": candidate.get("url", ""),
@@ -131,6 +185,7 @@ def api_generate():
         )
 
         update_candidate_status(candidate_id, "generated", generated_post_id=post_id)
+        _invalidate_cache()
         return jsonify({
             "ok": True,
             "post_id": post_id,
@@ -141,6 +196,7 @@ def api_generate():
     except Exception as e:
         error_msg = str(e)[:500]
         update_candidate_status(candidate_id, "error", error_message=error_msg)
+        _invalidate_cache()
         return jsonify({"error": error_msg}), 500
 
 
@@ -151,6 +207,7 @@ def api_reject_candidate(candidate_id):
         return jsonify({"error": "Candidate not found"}), 404
     reject_candidate(candidate["content_id"])
     update_candidate_status(candidate_id, "rejected")
+    _invalidate_cache()
     return jsonify({"ok": True, "candidate_id": candidate_id})
 
 
@@ -1,10 +1,18 @@
+import asyncio
+import hashlib
 import logging
 import os
+import re
 
 import anthropic
 
+from .database import cache_llm_response, get_cached_llm_response
+
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Claude requests when posts are generated individually
+MAX_CONCURRENT_REQUESTS = 5
+
 SYSTEM_PROMPT = """You are a fintech professional writing LinkedIn posts that demonstrate genuine expertise, not content marketing.
 
 Your voice is:
@@ -60,7 +68,32 @@ RED FLAGS YOU'RE DOING IT WRONG:
 - If you remove the source and nothing remains, you didn't add value
 """
 
-USER_PROMPT_TEMPLATE = """Source article:
+# Patterns used by _anti_cringe_filter(), compiled once at import
+EMOJI_RE = re.compile(
+    "[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U0001F900-\U0001F9FF"
+    "\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF\U00002600-\U000026FF]+",
+    flags=re.UNICODE,
+)
+CRINGE_RE = re.compile(
+    r"let that sink in\.?"
+    r"|read that again\.?"
+    r"|i'll say it louder for the people in the back\.?"
+    r"|agree\?",
+    re.IGNORECASE,
+)
+# Applied after CRINGE_RE: a "Thoughts?" may only become trailing once the
+# phrases after it are gone
+TRAILING_THOUGHTS_RE = re.compile(r"thoughts\?\s*$", re.IGNORECASE)
+# Literal prefixes of CRINGE_RE, checked before running any regex
+CRINGE_TRIGGERS = ("let that sink in", "read that again", "i'll say it louder", "agree?", "thoughts?")
+HASHTAG_RE = re.compile(r"#\w+")
+WHITESPACE_RE = re.compile(r"\n{3,}")
+
+
+def _format_user_prompt(author, source_name, title, url, content_summary) -> str:
+    """Build the single-article user prompt (inlined f-string, no format parsing)."""
+    return f"""Source article:
 Author: {author}
 Publication: {source_name}
 Title: {title}
@@ -118,6 +151,30 @@ class ContentGenerator:
             raise ValueError("ANTHROPIC_API_KEY is required")
         self.client = anthropic.Anthropic(api_key=self.api_key)
         self.model = model
+        self.cache_enabled = os.environ.get("LLM_CACHE_ENABLED", "0") == "1"
+
+    def _cache_key(self, prompt: str) -> str | None:
+        """Hash of model + prompts for the response cache, or None if disabled."""
+        if not self.cache_enabled:
+            return None
+        payload = f"{self.model}\0{SYSTEM_PROMPT}\0{prompt}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cached_result(self, content_item: dict, prompt: str) -> tuple[str | None, dict | None]:
+        """Return (cache_key, result); result is set only on a cache hit."""
+        cache_key = self._cache_key(prompt)
+        if cache_key:
+            cached = get_cached_llm_response(cache_key)
+            if cached is not None:
+                logger.info("Using cached post for: %s", content_item.get("title", "")[:80])
+                return cache_key, _post_result(content_item, cached)
+        return cache_key, None
+
+    def _store_result(self, cache_key: str | None, content_item: dict, text: str) -> dict:
+        """Cache a freshly generated post (if caching is on) and wrap it."""
+        if cache_key:
+            cache_llm_response(cache_key, text)
+        return _post_result(content_item, text)
 
     def generate_post(self, content_item: dict) -> dict:
         """Generate a LinkedIn post draft from a content item.
@@ -129,14 +186,10 @@ class ContentGenerator:
         Returns:
             dict with: source_summary, commentary, full_post
         """
-        prompt = USER_PROMPT_TEMPLATE.format(
-            source_type=content_item.get("source_type", "article"),
-            author=content_item.get("author") or content_item.get("source_name", "Unknown"),
-            title=content_item.get("title", ""),
-            url=content_item.get("url", ""),
-            content_summary=_truncate(content_item.get("content", ""), 2000),
-            source_name=content_item.get("source_name", ""),
-        )
+        prompt = _item_prompt(content_item)
+        cache_key, result = self._cached_result(content_item, prompt)
+        if result is not None:
+            return result
 
         logger.info("Generating post for: %s", content_item.get("title", "")[:80])
 
@@ -147,23 +200,29 @@ class ContentGenerator:
                 system=SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": prompt}],
             )
+            return self._store_result(cache_key, content_item, response.content[0].text.strip())
 
-            full_post = response.content[0].text.strip()
+        except anthropic.APIError as e:
+            logger.error("Claude API error: %s", e)
+            raise
 
-            # Build source summary
-            author = content_item.get("author") or content_item.get("source_name", "")
-            source_summary = f"Source: {author} — {content_item.get('title', '')}"
-            if content_item.get("url"):
-                source_summary += f"\nLink: {content_item['url']}"
+    async def _agenerate_post(self, aclient: anthropic.AsyncAnthropic, content_item: dict) -> dict:
+        """Async counterpart of generate_post(), used for concurrent batches."""
+        prompt = _item_prompt(content_item)
+        cache_key, result = self._cached_result(content_item, prompt)
+        if result is not None:
+            return result
 
-            # Apply anti-cringe filter
-            full_post = _anti_cringe_filter(full_post)
+        logger.info("Generating post for: %s", content_item.get("title", "")[:80])
 
-            return {
-                "source_summary": source_summary,
-                "commentary": full_post,
-                "full_post": full_post,
-            }
+        try:
+            response = await aclient.messages.create(
+                model=self.model,
+                max_tokens=1024,
+                system=SYSTEM_PROMPT,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            return self._store_result(cache_key, content_item, response.content[0].text.strip())
 
         except anthropic.APIError as e:
             logger.error("Claude API error: %s", e)
@@ -225,32 +284,46 @@ class ContentGenerator:
 
         results = []
         for item, post_text in zip(content_items, posts):
-            post_text = _anti_cringe_filter(post_text)
-            author = item.get("author") or item.get("source_name", "")
-            source_summary = f"Source: {author} — {item.get('title', '')}"
-            if item.get("url"):
-                source_summary += f"\nLink: {item['url']}"
-
-            results.append({
-                "source_summary": source_summary,
-                "commentary": post_text,
-                "full_post": post_text,
-                "content_item": item,
-            })
+            result = _post_result(item, post_text)
+            result["content_item"] = item
+            results.append(result)
 
         logger.info("Batch generation successful: %d posts", len(results))
         return results
 
     def _generate_batch_individual(self, content_items: list[dict]) -> list[dict]:
-        """Generate posts individually (original approach, used as fallback)."""
+        """Generate posts with one API call each (used as fallback).
+
+        Calls run concurrently, at most MAX_CONCURRENT_REQUESTS at a time. A
+        failed item is logged and skipped without affecting the others.
+        """
+        if not content_items:
+            return []
+        return asyncio.run(self._generate_batch_concurrent(content_items))
+
+    async def _generate_batch_concurrent(self, content_items: list[dict]) -> list[dict]:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        aclient = anthropic.AsyncAnthropic(api_key=self.api_key)
+
+        async def generate(item):
+            async with semaphore:
+                return await self._agenerate_post(aclient, item)
+
+        try:
+            outcomes = await asyncio.gather(
+                *(generate(item) for item in content_items),
+                return_exceptions=True,
+            )
+        finally:
+            await aclient.close()
+
         results = []
-        for item in content_items:
-            try:
-                result = self.generate_post(item)
-                result["content_item"] = item
-                results.append(result)
-            except Exception as e:
-                logger.error("Failed to generate post for '%s': %s", item.get("title", ""), e)
+        for item, outcome in zip(content_items, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("Failed to generate post for '%s': %s", item.get("title", ""), outcome)
+                continue
+            outcome["content_item"] = item
+            results.append(outcome)
         return results
 
 
@@ -261,55 +334,86 @@ def _parse_batch_response(raw_text: str, expected_count: int) -> list[str]:
         posts = [p.strip() for p in raw_text.split(separator) if p.strip()]
     else:
         # Fallback: try splitting on common patterns
-        import re
         posts = re.split(r'\n---+\n', raw_text)
         posts = [p.strip() for p in posts if p.strip()]
 
     return posts
 
 
+def _item_prompt(content_item: dict) -> str:
+    return _format_user_prompt(
+        author=content_item.get("author") or content_item.get("source_name", "Unknown"),
+        title=content_item.get("title", ""),
+        url=content_item.get("url", ""),
+        content_summary=_truncate(content_item.get("content", ""), 2000),
+        source_name=content_item.get("source_name", ""),
+    )
+
+
+def _source_summary(content_item: dict) -> str:
+    author = content_item.get("author") or content_item.get("source_name", "")
+    parts = [f"Source: {author} — {content_item.get('title', '')}"]
+    url = content_item.get("url")
+    if url:
+        parts.append(f"Link: {url}")
+    return "\n".join(parts)
+
+
+def _post_result(content_item: dict, full_post: str) -> dict:
+    """Wrap generated post text with its source summary, after filtering."""
+    full_post = _anti_cringe_filter(full_post)
+
+    return {
+        "source_summary": _source_summary(content_item),
+        "commentary": full_post,
+        "full_post": full_post,
+    }
+
+
 def _truncate(text: str, max_len: int) -> str:
     if len(text) <= max_len:
         return text
     return text[:max_len] + "..."
 
 
+def _keep_first_matches(pattern: re.Pattern, text: str, keep: int) -> str:
+    """Drop every match of pattern after the first `keep`, in a single pass."""
+    pieces = []
+    pos = 0
+    for i, match in enumerate(pattern.finditer(text)):
+        if i < keep:
+            continue
+        pieces.append(text[pos:match.start()])
+        pos = match.end()
+    if not pieces:
+        return text
+    pieces.append(text[pos:])
+    return "".join(pieces)
+
+
 def _anti_cringe_filter(text: str) -> str:
     """Remove common LinkedIn cringe patterns that slip through."""
-    import re
+    # Fast path: clean posts have nothing for any of the passes below to do
+    if (
+        "#" not in text
+        and "\n\n\n" not in text
+        and (not text or max(text) < "\u2600")
+        and not any(trigger in text.lower() for trigger in CRINGE_TRIGGERS)
+    ):
+        return text.strip()
 
     # Remove excessive emojis (keep max 1)
-    emoji_pattern = re.compile(
-        "[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF"
-        "\U0001F1E0-\U0001F1FF\U00002702-\U000027B0\U0001F900-\U0001F9FF"
-        "\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF\U00002600-\U000026FF]+",
-        flags=re.UNICODE,
-    )
-    emojis = emoji_pattern.findall(text)
-    if len(emojis) > 1:
-        # Keep only the first emoji
-        for emoji in emojis[1:]:
-            text = text.replace(emoji, "", 1)
+    text = _keep_first_matches(EMOJI_RE, text, keep=1)
 
     # Remove cringe phrases
-    cringe_phrases = [
-        r"(?i)let that sink in\.?",
-        r"(?i)read that again\.?",
-        r"(?i)i'll say it louder for the people in the back\.?",
-        r"(?i)agree\?",
-        r"(?i)thoughts\?\s*$",
-    ]
-    for pattern in cringe_phrases:
-        text = re.sub(pattern, "", text)
+    text = CRINGE_RE.sub("", text)
+    text = TRAILING_THOUGHTS_RE.sub("", text)
 
     # Remove excessive hashtags (keep max 3)
-    hashtags = re.findall(r"#\w+", text)
-    if len(hashtags) > 3:
-        for ht in hashtags[3:]:
-            text = text.replace(ht, "", 1)
+    text = _keep_first_matches(HASHTAG_RE, text, keep=3)
 
     # Clean up extra whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = WHITESPACE_RE.sub("\n\n", text)
     text = text.strip()
 
     return text
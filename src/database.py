@@ -1,6 +1,9 @@
+import atexit
+import json
 import sqlite3
 import os
-from datetime import datetime, timezone
+import threading
+from datetime import datetime, timedelta, timezone
 from contextlib import contextmanager
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "content_history.db")
@@ -10,20 +13,90 @@ def get_db_path():
     return os.environ.get("DATABASE_PATH", DB_PATH)
 
 
-@contextmanager
-def get_connection():
-    conn = sqlite3.connect(get_db_path())
+# One long-lived connection per thread, opened lazily by get_connection()
+_local = threading.local()
+_open_connections: list[sqlite3.Connection] = []
+_open_connections_lock = threading.Lock()
+_generation = 0  # bumped by close_all_connections() to invalidate cached ones
+
+
+def _connect(path):
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")
+    # Keep dirty pages in the cache until commit instead of spilling them to
+    # the journal mid-transaction (bulk scan inserts fit in 64 MB)
+    conn.execute("PRAGMA cache_spill=OFF")
+    with _open_connections_lock:
+        _open_connections.append(conn)
+    return conn
+
+
+@atexit.register
+def close_all_connections():
+    """Close every cached connection (also runs at interpreter exit).
+
+    Closing the last connection checkpoints the WAL back into the main
+    database file, which matters when the file is copied elsewhere.
+    """
+    global _generation
+    with _open_connections_lock:
+        while _open_connections:
+            _open_connections.pop().close()
+        _generation += 1
+
+
+@contextmanager
+def get_connection():
+    """Yield this thread's cached connection, committing on success.
+
+    The connection (and its pragmas) is set up once per thread and reused;
+    it is reopened only if DATABASE_PATH changes. Nested uses (e.g. inside
+    transaction()) share the outer transaction, which commits or rolls
+    back only when the outermost block exits.
+    """
+    depth = getattr(_local, "depth", 0)
+    conn = getattr(_local, "conn", None)
+    if depth == 0:
+        path = get_db_path()
+        if conn is None or _local.generation != _generation or _local.path != path:
+            if conn is not None and _local.generation == _generation:
+                with _open_connections_lock:
+                    _open_connections.remove(conn)
+                conn.close()
+            conn = _connect(path)
+            _local.conn = conn
+            _local.path = path
+            _local.generation = _generation
+    _local.depth = depth + 1
     try:
         yield conn
-        conn.commit()
+        if depth == 0:
+            conn.commit()
     except Exception:
-        conn.rollback()
+        if depth == 0:
+            conn.rollback()
         raise
     finally:
-        conn.close()
+        _local.depth = depth
+
+
+@contextmanager
+def transaction():
+    """Group several database calls into one write transaction.
+
+    Takes the write lock up front (BEGIN IMMEDIATE) so the batch commits
+    once at the end instead of once per call.
+    """
+    with get_connection() as conn:
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        yield conn
 
 
 def init_db():
@@ -39,7 +112,9 @@ def init_db():
                 priority INTEGER DEFAULT 5,
                 active BOOLEAN DEFAULT 1,
                 last_scanned TIMESTAMP,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                etag TEXT,           -- HTTP validators for conditional GETs
+                last_modified TEXT
             );
 
             CREATE TABLE IF NOT EXISTS scanned_content (
@@ -95,18 +170,29 @@ def init_db():
 
             CREATE INDEX IF NOT EXISTS idx_content_published
                 ON scanned_content(published_at);
-            CREATE INDEX IF NOT EXISTS idx_content_url
-                ON scanned_content(url);
-            CREATE INDEX IF NOT EXISTS idx_content_scanned_at
-                ON scanned_content(scanned_at);
-            CREATE INDEX IF NOT EXISTS idx_posts_status
-                ON generated_posts(status);
+            DROP INDEX IF EXISTS idx_content_url;
+            DROP INDEX IF EXISTS idx_content_scanned_at;
+            CREATE INDEX IF NOT EXISTS idx_sc_scanned_source
+                ON scanned_content(scanned_at DESC, source_id);
+            DROP INDEX IF EXISTS idx_posts_status;
+            CREATE INDEX IF NOT EXISTS idx_posts_status_gen
+                ON generated_posts(status, generated_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_posts_gen
+                ON generated_posts(generated_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_gp_content_id
+                ON generated_posts(content_id);
             CREATE INDEX IF NOT EXISTS idx_sources_type
                 ON sources(source_type);
+            CREATE INDEX IF NOT EXISTS idx_sources_active_priority
+                ON sources(active, priority DESC);
+            CREATE INDEX IF NOT EXISTS idx_sources_active_type_prio
+                ON sources(active, source_type, priority DESC);
             CREATE INDEX IF NOT EXISTS idx_rejected_run_date
                 ON rejected_articles(run_date);
             CREATE INDEX IF NOT EXISTS idx_source_failures_recorded
                 ON source_failures(recorded_at);
+            CREATE INDEX IF NOT EXISTS idx_failures_lookup
+                ON source_failures(source_id, failure_type, recorded_at DESC);
 
             CREATE TABLE IF NOT EXISTS ranked_candidates (
                 id INTEGER PRIMARY KEY,
@@ -139,72 +225,202 @@ def init_db():
 
             CREATE INDEX IF NOT EXISTS idx_rejections_content_id
                 ON candidate_rejections(content_id);
+
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                prompt_hash TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            CREATE TABLE IF NOT EXISTS score_cache (
+                item_key TEXT PRIMARY KEY,  -- sha1 of url/title/content
+                substance REAL NOT NULL,
+                engagement REAL NOT NULL,
+                computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
         """)
 
+        # Columns added after the first release
+        _add_column_if_missing(conn, "sources", "etag", "TEXT")
+        _add_column_if_missing(conn, "sources", "last_modified", "TEXT")
+
+        # Collect planner statistics once so the composite indexes get used
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name='sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            conn.execute("ANALYZE")
+
+
+def _add_column_if_missing(conn, table, column, decl):
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def optimize_db():
+    """End-of-run maintenance: refresh planner stats and truncate the WAL."""
+    with get_connection() as conn:
+        conn.execute("PRAGMA optimize")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+# Stay well under SQLITE_MAX_VARIABLE_NUMBER for IN (...) lists
+_IN_CHUNK_SIZE = 500
+
+
+def _dict_rows(conn, sql, params=()):
+    """Run a query and build plain dicts straight from tuple rows.
+
+    Skips the per-row sqlite3.Row allocation for results that are returned
+    as dicts (and often JSON-encoded) anyway.
+    """
+    return list(_iter_dict_rows(_tuple_cursor(conn, sql, params)))
+
+
+def _tuple_cursor(conn, sql, params=()):
+    """Execute a query on a cursor that returns plain tuples."""
+    cur = conn.cursor()
+    cur.row_factory = None
+    cur.execute(sql, params)
+    return cur
+
+
+def _iter_dict_rows(cur):
+    """Yield one dict per row of an executed _tuple_cursor."""
+    columns = [d[0] for d in cur.description]
+    for row in cur:
+        yield dict(zip(columns, row))
+
 
 # --- Source CRUD ---
 
+_UPSERT_SOURCE_SQL = """INSERT INTO sources (name, url, source_type, category, priority)
+       VALUES (?, ?, ?, ?, ?)
+       ON CONFLICT(url) DO UPDATE SET
+           name=excluded.name,
+           source_type=excluded.source_type,
+           category=excluded.category,
+           priority=excluded.priority"""
+
+
 def upsert_source(name, url, source_type, category=None, priority=5):
+    with get_connection() as conn:
+        conn.execute(_UPSERT_SOURCE_SQL, (name, url, source_type, category, priority))
+
+
+def upsert_sources(rows):
+    """Upsert many sources in a single statement.
+
+    rows are (name, url, source_type, category, priority) tuples. They are
+    passed as one JSON array and expanded by SQLite's json_each.
+    """
     with get_connection() as conn:
         conn.execute(
             """INSERT INTO sources (name, url, source_type, category, priority)
-               VALUES (?, ?, ?, ?, ?)
+               SELECT json_extract(value, '$[0]'), json_extract(value, '$[1]'),
+                      json_extract(value, '$[2]'), json_extract(value, '$[3]'),
+                      COALESCE(json_extract(value, '$[4]'), 5)
+               FROM json_each(?)
+               WHERE true  -- keeps ON CONFLICT from parsing as a join constraint
                ON CONFLICT(url) DO UPDATE SET
                    name=excluded.name,
                    source_type=excluded.source_type,
                    category=excluded.category,
                    priority=excluded.priority""",
-            (name, url, source_type, category, priority),
+            (json.dumps(list(rows)),),
         )
 
 
 def deactivate_sources_not_in(urls: set):
     """Deactivate any RSS sources whose URL is not in the given set."""
     with get_connection() as conn:
-        placeholders = ",".join("?" for _ in urls)
-        conn.execute(
-            f"UPDATE sources SET active=0 WHERE source_type='rss' AND url NOT IN ({placeholders})",
-            list(urls),
-        )
+        # Load the keep-list into an indexed temp table rather than binding
+        # one placeholder per URL
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS _keep_urls (url TEXT PRIMARY KEY)")
+        try:
+            conn.executemany(
+                "INSERT OR IGNORE INTO _keep_urls (url) VALUES (?)",
+                ((url,) for url in urls),
+            )
+            conn.execute(
+                """UPDATE sources SET active=0
+                   WHERE source_type='rss'
+                     AND url NOT IN (SELECT url FROM _keep_urls)"""
+            )
+        finally:
+            conn.execute("DROP TABLE temp._keep_urls")
 
 
 def get_active_sources(source_type=None):
     with get_connection() as conn:
         if source_type:
-            rows = conn.execute(
+            return _dict_rows(
+                conn,
                 "SELECT * FROM sources WHERE active=1 AND source_type=? ORDER BY priority DESC",
                 (source_type,),
-            ).fetchall()
+            )
         else:
-            rows = conn.execute(
+            return _dict_rows(
+                conn,
                 "SELECT * FROM sources WHERE active=1 ORDER BY priority DESC"
-            ).fetchall()
-        return [dict(r) for r in rows]
+            )
 
 
 def update_source_last_scanned(source_id):
     with get_connection() as conn:
         conn.execute(
-            "UPDATE sources SET last_scanned=? WHERE id=?",
-            (datetime.now(timezone.utc).isoformat(), source_id),
+            "UPDATE sources SET last_scanned=CURRENT_TIMESTAMP WHERE id=?",
+            (source_id,),
+        )
+
+
+def update_sources_last_scanned(source_ids):
+    """Stamp last_scanned on many sources with a single statement."""
+    source_ids = list(source_ids)
+    with get_connection() as conn:
+        for i in range(0, len(source_ids), _IN_CHUNK_SIZE):
+            chunk = source_ids[i:i + _IN_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            conn.execute(
+                f"UPDATE sources SET last_scanned=CURRENT_TIMESTAMP WHERE id IN ({placeholders})",
+                chunk,
+            )
+
+
+def update_sources_feed_meta(rows):
+    """Store HTTP validators from the latest fetch.
+
+    rows are (source_id, etag, last_modified) tuples.
+    """
+    with get_connection() as conn:
+        conn.executemany(
+            "UPDATE sources SET etag=?, last_modified=? WHERE id=?",
+            [(etag, last_modified, source_id) for source_id, etag, last_modified in rows],
         )
 
 
 # --- Scanned Content CRUD ---
 
-def insert_content(source_id, url, title, content, author=None, published_at=None):
-    """Insert content, returns id or None if duplicate."""
+def insert_content_bulk(source_id, items):
+    """Insert scanned items for one source, skipping duplicate URLs.
+
+    items are ScannedItem-like objects. Returns the number of new rows.
+    """
     with get_connection() as conn:
-        try:
-            cur = conn.execute(
-                """INSERT INTO scanned_content
-                   (source_id, url, title, content, author, published_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (source_id, url, title, content, author, published_at),
-            )
-            return cur.lastrowid
-        except sqlite3.IntegrityError:
-            return None
+        before = conn.total_changes
+        conn.executemany(
+            """INSERT INTO scanned_content
+               (source_id, url, title, content, author, published_at)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(url) DO NOTHING""",
+            [
+                (source_id, item.url, item.title, item.content,
+                 item.author, item.published_at)
+                for item in items
+            ],
+        )
+        return conn.total_changes - before
 
 
 def content_exists(url):
@@ -215,22 +431,56 @@ def content_exists(url):
         return row is not None
 
 
+def existing_urls(urls):
+    """Return the subset of ``urls`` that is already in scanned_content."""
+    urls = list(urls)
+    found = set()
+    with get_connection() as conn:
+        for i in range(0, len(urls), _IN_CHUNK_SIZE):
+            chunk = urls[i:i + _IN_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            found.update(
+                row[0] for row in conn.execute(
+                    f"SELECT url FROM scanned_content WHERE url IN ({placeholders})",
+                    chunk,
+                )
+            )
+    return found
+
+
 def get_recent_content(hours=48, limit=100):
+    # scanned_at is stored as CURRENT_TIMESTAMP text, so bind the cutoff in the
+    # same UTC "YYYY-MM-DD HH:MM:SS" format for a plain indexed range scan
+    cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).strftime("%Y-%m-%d %H:%M:%S")
     with get_connection() as conn:
-        rows = conn.execute(
+        return _dict_rows(
+            conn,
             """SELECT sc.*, s.name as source_name, s.source_type, s.category, s.priority
                FROM scanned_content sc
                JOIN sources s ON sc.source_id = s.id
-               WHERE sc.scanned_at >= datetime('now', ? || ' hours')
+               WHERE sc.scanned_at >= ?
                ORDER BY sc.scanned_at DESC
                LIMIT ?""",
-            (f"-{hours}", limit),
-        ).fetchall()
-        return [dict(r) for r in rows]
+            (cutoff, limit),
+        )
 
 
-def get_candidate_pool(days=5):
-    """Return all articles from the last N days that haven't been generated or rejected.
+_CANDIDATE_POOL_SQL = """SELECT sc.*, s.name as source_name, s.source_type,
+              s.category, s.priority
+       FROM scanned_content sc
+       JOIN sources s ON sc.source_id = s.id
+       WHERE sc.scanned_at >= datetime('now', ? || ' days')
+         AND NOT EXISTS (
+             SELECT 1 FROM generated_posts gp WHERE gp.content_id = sc.id)
+         AND NOT EXISTS (
+             SELECT 1 FROM candidate_rejections cr WHERE cr.content_id = sc.id)
+       ORDER BY sc.scanned_at DESC
+       LIMIT ?"""
+
+
+def get_candidate_pool(days=5, limit=500):
+    """Return the newest ``limit`` articles from the last N days that haven't been
+    generated or rejected.
 
     This creates a rolling pool where articles persist across multiple days until:
     - A post is generated from them (any status in generated_posts)
@@ -238,20 +488,19 @@ def get_candidate_pool(days=5):
     - They age out (older than ``days`` calendar days)
     """
     with get_connection() as conn:
-        rows = conn.execute(
-            """SELECT sc.*, s.name as source_name, s.source_type,
-                      s.category, s.priority
-               FROM scanned_content sc
-               JOIN sources s ON sc.source_id = s.id
-               LEFT JOIN generated_posts gp ON gp.content_id = sc.id
-               LEFT JOIN candidate_rejections cr ON cr.content_id = sc.id
-               WHERE sc.scanned_at >= datetime('now', ? || ' days')
-                 AND gp.id IS NULL
-                 AND cr.id IS NULL
-               ORDER BY sc.scanned_at DESC""",
-            (f"-{days}",),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        return _dict_rows(conn, _CANDIDATE_POOL_SQL, (f"-{days}", limit))
+
+
+def iter_candidate_pool(days=5, limit=500):
+    """Yield the candidate pool one dict at a time (see get_candidate_pool).
+
+    Only the query runs inside get_connection(); rows are read after it has
+    exited, so no transaction is held open between yields and writes made
+    while iterating commit as usual.
+    """
+    with get_connection() as conn:
+        cur = _tuple_cursor(conn, _CANDIDATE_POOL_SQL, (f"-{days}", limit))
+    yield from _iter_dict_rows(cur)
 
 
 def reject_candidate(content_id):
@@ -266,7 +515,7 @@ def reject_candidate(content_id):
 def get_rejected_candidates(limit=50):
     """Return user-rejected candidates with source info."""
     with get_connection() as conn:
-        rows = conn.execute(
+        return conn.execute(
             """SELECT sc.id as content_id, sc.title, sc.url, sc.scanned_at,
                       s.name as source_name, cr.rejected_at
                FROM candidate_rejections cr
@@ -276,17 +525,15 @@ def get_rejected_candidates(limit=50):
                LIMIT ?""",
             (limit,),
         ).fetchall()
-        return [dict(r) for r in rows]
 
 
 def mark_content_selected(content_ids):
     if not content_ids:
         return
     with get_connection() as conn:
-        placeholders = ",".join("?" for _ in content_ids)
-        conn.execute(
-            f"UPDATE scanned_content SET selected=1 WHERE id IN ({placeholders})",
-            content_ids,
+        conn.executemany(
+            "UPDATE scanned_content SET selected=1 WHERE id=?",
+            ((content_id,) for content_id in content_ids),
         )
 
 
@@ -303,36 +550,28 @@ def insert_post(content_id, source_summary, commentary, full_post):
         return cur.lastrowid
 
 
+_POSTS_QUERY = """SELECT gp.*, sc.url as source_url, sc.title as source_title,
+                  sc.author, s.name as source_name, s.category
+           FROM generated_posts gp
+           JOIN scanned_content sc ON gp.content_id = sc.id
+           JOIN sources s ON sc.source_id = s.id"""
+_POSTS_BY_STATUS_SQL = _POSTS_QUERY + """
+           WHERE gp.status = ?
+           ORDER BY gp.generated_at DESC
+           LIMIT ?"""
+_ALL_POSTS_SQL = _POSTS_QUERY + """
+           ORDER BY gp.generated_at DESC
+           LIMIT ?"""
+
+
 def get_drafts(limit=10):
-    with get_connection() as conn:
-        rows = conn.execute(
-            """SELECT gp.*, sc.url as source_url, sc.title as source_title,
-                      sc.author, s.name as source_name, s.category
-               FROM generated_posts gp
-               JOIN scanned_content sc ON gp.content_id = sc.id
-               JOIN sources s ON sc.source_id = s.id
-               WHERE gp.status = 'draft'
-               ORDER BY gp.generated_at DESC
-               LIMIT ?""",
-            (limit,),
-        ).fetchall()
-        return [dict(r) for r in rows]
+    return get_posts_by_status("draft", limit=limit)
 
 
 def get_posts_by_status(status, limit=50):
+    """Return posts as sqlite3.Row objects (dict() them before JSON encoding)."""
     with get_connection() as conn:
-        rows = conn.execute(
-            """SELECT gp.*, sc.url as source_url, sc.title as source_title,
-                      sc.author, s.name as source_name, s.category
-               FROM generated_posts gp
-               JOIN scanned_content sc ON gp.content_id = sc.id
-               JOIN sources s ON sc.source_id = s.id
-               WHERE gp.status = ?
-               ORDER BY gp.generated_at DESC
-               LIMIT ?""",
-            (status, limit),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        return conn.execute(_POSTS_BY_STATUS_SQL, (status, limit)).fetchall()
 
 
 def update_post_status(post_id, status):
@@ -356,18 +595,9 @@ def update_post_status(post_id, status):
 
 
 def get_all_posts(limit=100):
+    """Return posts as sqlite3.Row objects (dict() them before JSON encoding)."""
     with get_connection() as conn:
-        rows = conn.execute(
-            """SELECT gp.*, sc.url as source_url, sc.title as source_title,
-                      sc.author, s.name as source_name, s.category
-               FROM generated_posts gp
-               JOIN scanned_content sc ON gp.content_id = sc.id
-               JOIN sources s ON sc.source_id = s.id
-               ORDER BY gp.generated_at DESC
-               LIMIT ?""",
-            (limit,),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        return conn.execute(_ALL_POSTS_SQL, (limit,)).fetchall()
 
 
 # --- Rejected Articles CRUD ---
@@ -377,40 +607,41 @@ def insert_rejected_articles(run_date: str, articles: list[dict]):
     with get_connection() as conn:
         # Clear previous entries for the same run date
         conn.execute("DELETE FROM rejected_articles WHERE run_date = ?", (run_date,))
+        params = []
         for article in articles:
             breakdown = article.get("score_breakdown", {})
-            conn.execute(
-                """INSERT INTO rejected_articles
-                   (run_date, content_id, title, url, source_name,
-                    total_score, recency_score, substance_score,
-                    authority_score, engagement_score, rejection_reason)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    run_date,
-                    article.get("id"),
-                    article.get("title", ""),
-                    article.get("url", ""),
-                    article.get("source_name", ""),
-                    article.get("engagement_score", 0),
-                    breakdown.get("recency", 0),
-                    breakdown.get("substance", 0),
-                    breakdown.get("authority", 0),
-                    breakdown.get("engagement", 0),
-                    article.get("rejection_reason", ""),
-                ),
-            )
+            params.append((
+                run_date,
+                article.get("id"),
+                article.get("title", ""),
+                article.get("url", ""),
+                article.get("source_name", ""),
+                article.get("engagement_score", 0),
+                breakdown.get("recency", 0),
+                breakdown.get("substance", 0),
+                breakdown.get("authority", 0),
+                breakdown.get("engagement", 0),
+                article.get("rejection_reason", ""),
+            ))
+        conn.executemany(
+            """INSERT INTO rejected_articles
+               (run_date, content_id, title, url, source_name,
+                total_score, recency_score, substance_score,
+                authority_score, engagement_score, rejection_reason)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            params,
+        )
 
 
 def get_rejected_articles(limit=20):
     """Get the most recent rejected articles."""
     with get_connection() as conn:
-        rows = conn.execute(
+        return conn.execute(
             """SELECT * FROM rejected_articles
                ORDER BY run_date DESC, total_score DESC
                LIMIT ?""",
             (limit,),
         ).fetchall()
-        return [dict(r) for r in rows]
 
 
 # --- Source Failures CRUD ---
@@ -444,13 +675,12 @@ def get_consecutive_zero_count(source_id):
 def get_recent_failures(limit=50):
     """Get recent source failures for dashboard display."""
     with get_connection() as conn:
-        rows = conn.execute(
+        return conn.execute(
             """SELECT * FROM source_failures
                ORDER BY recorded_at DESC
                LIMIT ?""",
             (limit,),
         ).fetchall()
-        return [dict(r) for r in rows]
 
 
 # --- Ranked Candidates CRUD ---
@@ -459,28 +689,30 @@ def insert_ranked_candidates(run_date: str, candidates: list[dict]):
     """Store ranked candidate articles, replacing any previous candidates."""
     with get_connection() as conn:
         conn.execute("DELETE FROM ranked_candidates")
+        params = []
         for candidate in candidates:
             breakdown = candidate.get("score_breakdown", {})
-            conn.execute(
-                """INSERT INTO ranked_candidates
-                   (run_date, content_id, title, url, source_name, category,
-                    total_score, recency_score, substance_score,
-                    authority_score, engagement_score)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    run_date,
-                    candidate.get("id"),
-                    candidate.get("title", ""),
-                    candidate.get("url", ""),
-                    candidate.get("source_name", ""),
-                    candidate.get("category", ""),
-                    candidate.get("engagement_score", 0),
-                    breakdown.get("recency", 0),
-                    breakdown.get("substance", 0),
-                    breakdown.get("authority", 0),
-                    breakdown.get("engagement", 0),
-                ),
-            )
+            params.append((
+                run_date,
+                candidate.get("id"),
+                candidate.get("title", ""),
+                candidate.get("url", ""),
+                candidate.get("source_name", ""),
+                candidate.get("category", ""),
+                candidate.get("engagement_score", 0),
+                breakdown.get("recency", 0),
+                breakdown.get("substance", 0),
+                breakdown.get("authority", 0),
+                breakdown.get("engagement", 0),
+            ))
+        conn.executemany(
+            """INSERT INTO ranked_candidates
+               (run_date, content_id, title, url, source_name, category,
+                total_score, recency_score, substance_score,
+                authority_score, engagement_score)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            params,
+        )
 
 
 def get_ranked_candidates():
@@ -493,7 +725,7 @@ def get_ranked_candidates():
         conn.execute(
             "UPDATE ranked_candidates SET status = 'candidate' WHERE status = 'generating'"
         )
-        rows = conn.execute(
+        return conn.execute(
             """SELECT rc.*, sc.content, sc.published_at,
                       gp.full_post as generated_post_text
                FROM ranked_candidates rc
@@ -501,7 +733,6 @@ def get_ranked_candidates():
                LEFT JOIN generated_posts gp ON rc.generated_post_id = gp.id
                ORDER BY rc.total_score DESC"""
         ).fetchall()
-        return [dict(r) for r in rows]
 
 
 def get_candidate(candidate_id):
@@ -529,3 +760,52 @@ def update_candidate_status(candidate_id, status, generated_post_id=None,
                WHERE id = ?""",
             (status, generated_post_id, error_message, candidate_id),
         )
+
+
+# --- LLM Response Cache ---
+
+def get_cached_llm_response(prompt_hash):
+    """Return the cached Claude response for a prompt hash, or None."""
+    with get_connection() as conn:
+        row = conn.execute(
+            "SELECT response FROM llm_cache WHERE prompt_hash = ?", (prompt_hash,)
+        ).fetchone()
+        return row["response"] if row else None
+
+
+def cache_llm_response(prompt_hash, response):
+    with get_connection() as conn:
+        conn.execute(
+            """INSERT OR REPLACE INTO llm_cache (prompt_hash, response)
+               VALUES (?, ?)""",
+            (prompt_hash, response),
+        )
+
+
+# --- Ranker Score Cache ---
+
+SCORE_CACHE_MAX_AGE_DAYS = 14
+
+
+def load_score_cache():
+    """Return {item_key: (substance, engagement)} for all cached scores."""
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        cur.execute("SELECT item_key, substance, engagement FROM score_cache")
+        return {key: (substance, engagement) for key, substance, engagement in cur}
+
+
+def save_score_cache(entries):
+    """Store new {item_key: (substance, engagement)} entries and prune old ones."""
+    with get_connection() as conn:
+        conn.executemany(
+            """INSERT OR REPLACE INTO score_cache (item_key, substance, engagement)
+               VALUES (?, ?, ?)""",
+            [(key, substance, engagement)
+             for key, (substance, engagement) in entries.items()],
+        )
+        conn.execute(
+            "DELETE FROM score_cache WHERE computed_at < datetime('now', ?)",
+            (f"-{SCORE_CACHE_MAX_AGE_DAYS} days",),
+        )
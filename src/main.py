@@ -7,22 +7,33 @@ import sys
 
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv(os.path.join(os.path.dirname(__file__), "..", ".env"))
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from src.database import (
     deactivate_sources_not_in,
+    existing_urls,
     get_active_sources,
-    get_candidate_pool,
     get_consecutive_zero_count,
     init_db,
-    insert_content,
+    insert_content_bulk,
     insert_ranked_candidates,
     insert_rejected_articles,
     insert_source_failure,
-    update_source_last_scanned,
-    upsert_source,
+    iter_candidate_pool,
+    load_score_cache,
+    optimize_db,
+    save_score_cache,
+    transaction,
+    update_sources_feed_meta,
+    update_sources_last_scanned,
+    upsert_sources,
 )
 from src.ranker import get_last_rejected, rank_content
 from src.scanners.rss_scanner import RSSScanner
@@ -38,58 +49,74 @@ logger = logging.getLogger(__name__)
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config", "sources.json")
 
+# Feed fetches are network-bound, so scan this many sources concurrently
+MAX_SCAN_WORKERS = 8
+
 _config_cache = None
+_config_mtime = None
 
 
 def _load_config():
-    """Load and cache config from sources.json."""
-    global _config_cache
-    if _config_cache is None:
-        with open(CONFIG_PATH, "r") as f:
-            _config_cache = json.load(f)
+    """Load and cache config from sources.json, re-reading it if the file changed."""
+    global _config_cache, _config_mtime
+    mtime = os.stat(CONFIG_PATH).st_mtime
+    if _config_cache is None or mtime != _config_mtime:
+        with open(CONFIG_PATH, "rb") as f:
+            data = f.read()
+        _config_cache = orjson.loads(data) if orjson is not None else json.loads(data)
+        _config_mtime = mtime
     return _config_cache
 
 
-def load_sources_from_config():
-    """Load sources from config/sources.json into the database."""
-    config = _load_config()
+RSS_SECTIONS = ("newsletters", "blogs", "news", "regulatory", "academic", "vc_blogs")
 
-    count = 0
+
+def _flatten_sources(config):
+    """Flatten the config into (name, url, source_type, category, priority) rows.
+
+    Returns the rows plus the set of enabled RSS URLs.
+    """
+    rows = []
     active_rss_urls = set()
 
     # Twitter accounts
     for acct in config.get("twitter_accounts", []):
-        url = f"https://twitter.com/{acct['handle']}"
-        upsert_source(
-            name=acct["name"],
-            url=url,
-            source_type="twitter",
-            category=acct.get("category"),
-            priority=acct.get("priority", 5),
-        )
-        count += 1
+        rows.append((
+            acct["name"],
+            f"https://twitter.com/{acct['handle']}",
+            "twitter",
+            acct.get("category"),
+            acct.get("priority", 5),
+        ))
 
     # RSS sources (all sections with url field)
-    for section in ("newsletters", "blogs", "news", "regulatory", "academic", "vc_blogs"):
+    for section in RSS_SECTIONS:
         for src in config.get(section, []):
             if src.get("enabled") is False:
                 continue
-            upsert_source(
-                name=src["name"],
-                url=src["url"],
-                source_type="rss",
-                category=src.get("category"),
-                priority=src.get("priority", 5),
-            )
+            rows.append((
+                src["name"],
+                src["url"],
+                "rss",
+                src.get("category"),
+                src.get("priority", 5),
+            ))
             active_rss_urls.add(src["url"])
-            count += 1
+
+    return rows, active_rss_urls
+
+
+def load_sources_from_config():
+    """Load sources from config/sources.json into the database."""
+    rows, active_rss_urls = _flatten_sources(_load_config())
+    upsert_sources(rows)
 
     # Deactivate any RSS sources in the DB whose URL is no longer in the config
     # (handles removed sources, changed URLs, and disabled sources)
     if active_rss_urls:
         deactivate_sources_not_in(active_rss_urls)
 
-    logger.info("Loaded %d sources from config", count)
+    logger.info("Loaded %d sources from config", len(rows))
 
 
 def scan_all_sources():
@@ -99,77 +126,83 @@ def scan_all_sources():
     total_items = 0
     failure_count = 0
     zero_count = 0
+    unchanged_count = 0
+    failure_log = []
 
     # Scan RSS sources
     rss_sources = get_active_sources("rss")
     logger.info("Scanning %d RSS sources...", len(rss_sources))
-    for source in rss_sources:
-        items, failure_info = rss_scanner.scan_safe(source)
-
-        if failure_info:
-            # Hard failure — log it
-            failure_count += 1
-            insert_source_failure(
-                source_id=source["id"],
-                source_name=source["name"],
-                source_url=source["url"],
-                failure_type=failure_info["failure_type"],
-                error_message=failure_info["error_message"],
-            )
-            _append_failure_log(source, failure_info)
-        elif len(items) == 0:
-            # Soft failure — zero results
-            zero_count += 1
-            prev_count = get_consecutive_zero_count(source["id"])
-            new_count = prev_count + 1
-            insert_source_failure(
-                source_id=source["id"],
-                source_name=source["name"],
-                source_url=source["url"],
-                failure_type="zero_results",
-                error_message=f"Consecutive zero-result runs: {new_count}",
-                consecutive_zero_count=new_count,
-            )
-            if new_count >= 3:
-                logger.warning(
-                    "Source '%s' has returned 0 articles for %d consecutive runs",
-                    source["name"], new_count,
+    # Fetch in parallel, but keep every database write on this thread
+    results = rss_scanner.scan_many(rss_sources, max_workers=MAX_SCAN_WORKERS)
+
+    # Store all results in one transaction: a single commit for the whole scan
+    with transaction():
+        for source, (items, failure_info) in zip(rss_sources, results):
+            if failure_info:
+                # Hard failure — log it
+                failure_count += 1
+                insert_source_failure(
+                    source_id=source["id"],
+                    source_name=source["name"],
+                    source_url=source["url"],
+                    failure_type=failure_info["failure_type"],
+                    error_message=failure_info["error_message"],
                 )
-        else:
-            for item in items:
-                content_id = insert_content(
+                failure_log.append(_failure_log_entry(source, failure_info))
+            elif rss_scanner.feed_meta.get(source["id"], {}).get("not_modified"):
+                # 304 Not Modified — nothing new, and not a failure
+                unchanged_count += 1
+            elif len(items) == 0:
+                # Soft failure — zero results
+                zero_count += 1
+                prev_count = get_consecutive_zero_count(source["id"])
+                new_count = prev_count + 1
+                insert_source_failure(
                     source_id=source["id"],
-                    url=item.url,
-                    title=item.title,
-                    content=item.content,
-                    author=item.author,
-                    published_at=item.published_at,
+                    source_name=source["name"],
+                    source_url=source["url"],
+                    failure_type="zero_results",
+                    error_message=f"Consecutive zero-result runs: {new_count}",
+                    consecutive_zero_count=new_count,
                 )
-                if content_id:
-                    total_items += 1
+                if new_count >= 3:
+                    logger.warning(
+                        "Source '%s' has returned 0 articles for %d consecutive runs",
+                        source["name"], new_count,
+                    )
+            else:
+                # Most items in an incremental scan are already stored; drop
+                # them with one lookup instead of sending them to the INSERT
+                known = existing_urls(item.url for item in items)
+                new_items = [item for item in items if item.url not in known]
+                if new_items:
+                    total_items += insert_content_bulk(source["id"], new_items)
+
+        update_sources_last_scanned(source["id"] for source in rss_sources)
+        update_sources_feed_meta(
+            (source_id, meta["etag"], meta["last_modified"])
+            for source_id, meta in rss_scanner.feed_meta.items()
+            if not meta.get("not_modified")
+        )
 
-        update_source_last_scanned(source["id"])
+    _append_failure_log(failure_log)
 
     # Twitter scanning disabled - Nitter/RSSHub no longer work after Twitter API changes
     logger.info("Skipping Twitter sources (free RSS bridges no longer available)")
 
     logger.info(
-        "Scanning complete. %d new items stored. %d hard failures, %d zero-result sources.",
-        total_items, failure_count, zero_count,
+        "Scanning complete. %d new items stored. %d hard failures, %d zero-result sources, "
+        "%d unchanged feeds.",
+        total_items, failure_count, zero_count, unchanged_count,
     )
     return total_items
 
 
-def _append_failure_log(source: dict, failure_info: dict):
-    """Append a failure entry to the dedicated failure log file."""
-    import json
+def _failure_log_entry(source: dict, failure_info: dict) -> dict:
+    """Build one line of the dedicated failure log."""
     from datetime import datetime, timezone
 
-    log_dir = os.path.join(os.path.dirname(__file__), "..", "data")
-    os.makedirs(log_dir, exist_ok=True)
-    log_path = os.path.join(log_dir, "source_failures.jsonl")
-
-    entry = {
+    return {
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "source_name": source.get("name", ""),
         "source_url": source.get("url", ""),
@@ -177,24 +210,43 @@ def _append_failure_log(source: dict, failure_info: dict):
         "error_message": failure_info["error_message"],
     }
 
-    with open(log_path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(entry) + "\n")
+
+def _append_failure_log(entries: list[dict]):
+    """Append failure entries to the dedicated failure log file in one write."""
+    if not entries:
+        return
+
+    log_dir = os.path.join(os.path.dirname(__file__), "..", "data")
+    os.makedirs(log_dir, exist_ok=True)
+    log_path = os.path.join(log_dir, "source_failures.jsonl")
+
+    if orjson is not None:
+        data = b"".join(orjson.dumps(entry) + b"\n" for entry in entries)
+    else:
+        data = "".join(json.dumps(entry) + "\n" for entry in entries).encode("utf-8")
+    with open(log_path, "ab") as f:
+        f.write(data)
 
 
 def rank_candidates(top_n=20):
     """Rank the multi-day candidate pool and store top candidates for manual selection."""
     from datetime import date
 
-    pool = get_candidate_pool(days=5)
-    if not pool:
-        logger.warning("No candidate articles in pool. Skipping ranking.")
-        return []
-
-    logger.info("Ranking %d articles from candidate pool (5-day window)...", len(pool))
-    top_items = rank_content(pool, top_n=top_n)
+    # Stream the pool straight from the cursor into the ranker rather than
+    # materializing it as a list first
+    logger.info("Ranking articles from candidate pool (5-day window)...")
+    # Items stay in the pool for several days; reuse their text scores
+    score_cache = load_score_cache()
+    cached_keys = set(score_cache)
+    top_items = rank_content(iter_candidate_pool(days=5), top_n=top_n,
+                             score_cache=score_cache)
+    save_score_cache({k: v for k, v in score_cache.items() if k not in cached_keys})
 
     # Store rejected articles for dashboard
     rejected = get_last_rejected()
+    if not top_items and not rejected:
+        logger.warning("No candidate articles in pool. Skipping ranking.")
+        return []
     if rejected:
         run_date = date.today().isoformat()
         insert_rejected_articles(run_date, rejected)
@@ -228,6 +280,9 @@ def run_daily():
     # 3. Rank content from multi-day candidate pool
     rank_candidates(top_n=20)
 
+    # 4. Keep planner statistics current and the WAL file small
+    optimize_db()
+
     logger.info("Daily run complete.")
 
 
@@ -1,8 +1,11 @@
+import hashlib
 import logging
 import math
 import re
+from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime, timezone
-from difflib import SequenceMatcher
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from dateutil import parser as date_parser
 
@@ -11,8 +14,30 @@ logger = logging.getLogger(__name__)
 
 MAX_AGE_DAYS = 180  # 6 months
 
-
-def rank_content(items: list[dict], top_n: int = 20) -> list[dict]:
+# Part of every score cache key. Bump it whenever the substance/engagement
+# heuristics or weights change, so scores cached by older logic are ignored.
+SCORER_VERSION = 1
+
+# Compiled once at import; the scoring helpers run for every pool item
+NUMBERS_RE = re.compile(r"\$[\d,.]+[BMK]?|\d+%|\d{4,}")
+QUOTE_RE = re.compile(r'["""\u201c\u201d][^"""\u201c\u201d]+["""\u201c\u201d]')
+LINK_RE = re.compile(r"https?://")
+
+HIGH_SIGNAL_KEYWORDS = (
+    "breaking", "exclusive", "announced", "launched", "partnership",
+    "acquisition", "regulation", "billion", "million", "approval",
+    "ban", "investigation", "patent", "settlement",
+)
+TOPIC_KEYWORDS = (
+    "stablecoin", "cbdc", "tokenization", "embedded finance",
+    "banking as a service", "baas", "real-time payments",
+    "cross-border", "defi", "regtech", "open banking",
+    "generative ai", "llm", "artificial intelligence",
+)
+
+
+def rank_content(items: Iterable[dict], top_n: int = 20,
+                 score_cache: dict | None = None) -> list[dict]:
     """Score and rank content items, returning the top N by score.
 
     Scoring factors:
@@ -21,18 +46,29 @@ def rank_content(items: list[dict], top_n: int = 20) -> list[dict]:
     - Source authority (priority from config)
     - Engagement quality (links, mentions, specificity)
 
-    Deduplicates by URL and content similarity before ranking.
+    Deduplicates by URL and content similarity before ranking. ``items`` may
+    be any iterable (e.g. a lazy database cursor); it is consumed once.
+
+    ``score_cache`` optionally maps item keys to (substance, engagement)
+    scores from earlier runs; hits skip the text scoring and misses are added
+    to it. Recency and authority are always recomputed.
     """
-    if not items:
-        return []
+    global _last_rejected
 
     # Deduplicate
     items = _deduplicate(items)
+    if not items:
+        _last_rejected = []
+        return []
 
-    # Score each item with full breakdown
+    # Score each item with full breakdown, against one shared "now"
+    now = _utcnow()
     scored = []
     for item in items:
-        breakdown = _compute_score_breakdown(item)
+        if score_cache is None:
+            breakdown = _compute_score_breakdown(item, now)
+        else:
+            breakdown = _cached_score_breakdown(item, score_cache, now)
         total = sum(breakdown.values())
         if total > 0:
             scored.append({
@@ -59,7 +95,6 @@ def rank_content(items: list[dict], top_n: int = 20) -> list[dict]:
     )
 
     # Store rejected articles for dashboard visibility (module-level cache)
-    global _last_rejected
     _last_rejected = rejected[:20]
 
     return selected
@@ -78,29 +113,82 @@ def _compute_score(item: dict) -> float:
     return sum(_compute_score_breakdown(item).values())
 
 
-def _compute_score_breakdown(item: dict) -> dict:
+def _compute_score_breakdown(item: dict, now: datetime | None = None) -> dict:
     """Return individual score components as a dict."""
+    substance, engagement = _text_scores(item)
     return {
-        "recency": _recency_score(item.get("published_at")),
-        "substance": _substance_score(item.get("content", ""), item.get("title", "")),
+        "recency": _recency_score(item.get("published_at"), now),
+        "substance": substance,
         "authority": _authority_score(item.get("priority", 5)),
-        "engagement": _engagement_score(item.get("content", ""), item.get("title", "")),
+        "engagement": engagement,
     }
 
 
-def _recency_score(published_at: str | None) -> float:
+def _text_scores(item: dict) -> tuple[float, float]:
+    """Substance and engagement scores, sharing one combined/lowercased text."""
+    content = item.get("content", "")
+    text = f"{item.get('title', '')} {content}"
+    return _substance_score(text), _engagement_score(text.lower(), content)
+
+
+def _score_key(item: dict) -> str:
+    """Cache key for the text-derived scores: changes with their inputs or SCORER_VERSION."""
+    raw = "\0".join((
+        str(SCORER_VERSION),
+        item.get("url") or "",
+        item.get("title") or "",
+        item.get("content") or "",
+    ))
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _cached_score_breakdown(item: dict, score_cache: dict,
+                            now: datetime | None = None) -> dict:
+    """_compute_score_breakdown, reusing cached substance/engagement scores."""
+    key = _score_key(item)
+    cached = score_cache.get(key)
+    if cached is None:
+        cached = _text_scores(item)
+        score_cache[key] = cached
+    substance, engagement = cached
+    return {
+        "recency": _recency_score(item.get("published_at"), now),
+        "substance": substance,
+        "authority": _authority_score(item.get("priority", 5)),
+        "engagement": engagement,
+    }
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as a naive datetime, the form used for date comparisons."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _parse_published(published_at: str) -> datetime:
+    """Parse a publication date, trying the fast ISO-8601 parser first.
+
+    Scanners store dates as ISO strings, so dateutil's fuzzy parser is only
+    needed for the occasional raw feed date.
+    """
+    try:
+        return datetime.fromisoformat(published_at)
+    except ValueError:
+        return date_parser.parse(published_at, fuzzy=True)
+
+
+def _recency_score(published_at: str | None, now: datetime | None = None) -> float:
     """Exponential decay based on age. Max 30 points. Returns 0 for missing/old dates."""
     if not published_at:
         return 0.0  # No date = not usable
 
     try:
-        dt = date_parser.parse(published_at, fuzzy=True)
+        dt = _parse_published(published_at)
 
         # Make naive for comparison
         if dt.tzinfo is not None:
             dt = dt.replace(tzinfo=None)
 
-        days_old = (datetime.now(timezone.utc).replace(tzinfo=None) - dt).total_seconds() / 86400
+        days_old = ((now or _utcnow()) - dt).total_seconds() / 86400
 
         # Reject anything older than MAX_AGE_DAYS (6 months)
         if days_old > MAX_AGE_DAYS:
@@ -113,10 +201,9 @@ def _recency_score(published_at: str | None) -> float:
         return 0.0
 
 
-def _substance_score(content: str, title: str) -> float:
-    """Score based on content depth. Max 25 points."""
+def _substance_score(text: str) -> float:
+    """Score based on content depth of "title content" text. Max 25 points."""
     score = 0.0
-    text = f"{title} {content}"
     word_count = len(text.split())
 
     # Length bonus (diminishing returns)
@@ -128,12 +215,12 @@ def _substance_score(content: str, title: str) -> float:
         score += 5
 
     # Contains numbers/data (suggests concrete information)
-    numbers = re.findall(r"\$[\d,.]+[BMK]?|\d+%|\d{4,}", text)
+    numbers = NUMBERS_RE.findall(text)
     if numbers:
         score += min(len(numbers) * 2, 5)
 
     # Contains quotes (suggests insider access)
-    if re.search(r'["""\u201c\u201d][^"""\u201c\u201d]+["""\u201c\u201d]', text):
+    if QUOTE_RE.search(text):
         score += 5
 
     return min(score, 25.0)
@@ -145,65 +232,99 @@ def _authority_score(priority: int) -> float:
     return min(priority * 2, 20.0)
 
 
-def _engagement_score(content: str, title: str) -> float:
-    """Score based on engagement-worthy signals. Max 25 points."""
+def _engagement_score(text_lower: str, content: str) -> float:
+    """Score based on engagement-worthy signals. Max 25 points.
+
+    ``text_lower`` is the lowercased "title content" text; the link check
+    looks at the raw content only.
+    """
     score = 0.0
-    text = f"{title} {content}".lower()
 
     # High-signal keywords
-    high_signal = [
-        "breaking", "exclusive", "announced", "launched", "partnership",
-        "acquisition", "regulation", "billion", "million", "approval",
-        "ban", "investigation", "patent", "settlement",
-    ]
-    matches = sum(1 for kw in high_signal if kw in text)
+    matches = sum(1 for kw in HIGH_SIGNAL_KEYWORDS if kw in text_lower)
     score += min(matches * 3, 10)
 
     # Topic relevance boosters
-    topic_keywords = [
-        "stablecoin", "cbdc", "tokenization", "embedded finance",
-        "banking as a service", "baas", "real-time payments",
-        "cross-border", "defi", "regtech", "open banking",
-        "generative ai", "llm", "artificial intelligence",
-    ]
-    topic_matches = sum(1 for kw in topic_keywords if kw in text)
+    topic_matches = sum(1 for kw in TOPIC_KEYWORDS if kw in text_lower)
     score += min(topic_matches * 2, 10)
 
     # Contains a link (more shareable)
-    if re.search(r"https?://", content):
+    if LINK_RE.search(content):
         score += 5
 
     return min(score, 25.0)
 
 
-def _deduplicate(items: list[dict]) -> list[dict]:
-    """Remove duplicates by URL and content similarity."""
+def _deduplicate(items: Iterable[dict]) -> list[dict]:
+    """Remove duplicates by URL and content similarity.
+
+    Two items are near-duplicates when the difflib ``quick_ratio`` of their
+    first 500 content characters exceeds 0.8. That ratio only depends on
+    character counts, so each kept item's Counter is built once and reused
+    for every later comparison instead of rebuilding a SequenceMatcher.
+    """
     seen_urls = set()
     unique = []
+    kept_profiles = []  # (char Counter, length) of kept items with content
+    total = 0
 
     for item in items:
+        total += 1
         url = item.get("url", "")
 
-        # Exact URL duplicate
+        # Exact URL duplicate (ignoring tracking parameters and fragments)
+        url = _canon_url(url)
         if url in seen_urls:
             continue
         seen_urls.add(url)
 
         # Content similarity check against already-kept items
         content = item.get("content", "")[:500]
-        is_dup = False
-        for kept in unique:
-            kept_content = kept.get("content", "")[:500]
-            if content and kept_content:
-                similarity = SequenceMatcher(None, content, kept_content).quick_ratio()
-                if similarity > 0.8:
-                    is_dup = True
-                    break
+        if content:
+            profile = (Counter(content), len(content))
+            if any(_is_near_duplicate(profile, kept) for kept in kept_profiles):
+                continue
+            kept_profiles.append(profile)
 
-        if not is_dup:
-            unique.append(item)
+        unique.append(item)
 
-    if len(items) != len(unique):
-        logger.info("Deduplication: %d -> %d items", len(items), len(unique))
+    if total != len(unique):
+        logger.info("Deduplication: %d -> %d items", total, len(unique))
 
     return unique
+
+
+TRACKING_PARAMS = frozenset({"ref", "fbclid", "gclid"})
+
+
+def _canon_url(url: str) -> str:
+    """Normalize a URL for duplicate detection.
+
+    Lowercases the host, drops the fragment, a trailing slash and tracking
+    query parameters (utm_*, ref, fbclid, gclid).
+    """
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith("utm_") and k not in TRACKING_PARAMS
+    ])
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, query, ""))
+
+
+def _is_near_duplicate(a: tuple[Counter, int], b: tuple[Counter, int]) -> bool:
+    # quick_ratio can never exceed 2*min(la, lb) / (la + lb), so pairs whose
+    # lengths differ too much are rejected without touching the Counters
+    la, lb = a[1], b[1]
+    if 2 * min(la, lb) <= 0.8 * (la + lb):
+        return False
+    return _quick_ratio(a, b) > 0.8
+
+
+def _quick_ratio(a: tuple[Counter, int], b: tuple[Counter, int]) -> float:
+    """Same value as SequenceMatcher(None, a, b).quick_ratio() on the profiled strings."""
+    matches = sum((a[0] & b[0]).values())
+    return 2.0 * matches / (a[1] + b[1])
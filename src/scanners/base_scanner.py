@@ -1,11 +1,16 @@
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Optional
+from urllib.parse import urlparse
 
+import requests
 from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +26,67 @@ class ScannedItem:
     metadata: dict = field(default_factory=dict)
 
 
+def _make_session(max_retries=0) -> requests.Session:
+    """A pooled session, so repeat requests to a host reuse its TCP/TLS connection.
+
+    requests already sends keep-alive and ``Accept-Encoding: gzip, deflate``
+    (plus br/zstd when urllib3 can decode them) and decompresses responses.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=max_retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def read_capped(resp, limit: int) -> bytes:
+    """Read a streamed response body, stopping after ``limit`` bytes.
+
+    Oversized bodies are cut off instead of being held in memory whole. The
+    response is closed either way.
+    """
+    chunks = []
+    size = 0
+    try:
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                logger.info("Truncated %s at %d bytes", resp.url, limit)
+                break
+    finally:
+        resp.close()
+    return b"".join(chunks)[:limit]
+
+
 class BaseScanner(ABC):
     """Abstract base class for all content scanners."""
 
+    # Adapter-level retries for the scanner's session (an int or urllib3 Retry)
+    http_retries = 0
+
     def __init__(self, rate_limit_seconds=2.0):
         self.rate_limit_seconds = rate_limit_seconds
-        self._last_request_time = 0.0
+        self._last_request_time: dict[str, float] = {}
+        self._rate_lock = threading.Lock()
+        self._session = _make_session(self.http_retries)
+
+    def _rate_limit(self, url: str = ""):
+        """Space requests to the same host by rate_limit_seconds.
 
-    def _rate_limit(self):
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.rate_limit_seconds:
-            time.sleep(self.rate_limit_seconds - elapsed)
-        self._last_request_time = time.time()
+        Different hosts don't wait on each other. Safe to call from several
+        threads: each caller reserves its host's next slot under the lock and
+        then sleeps outside it.
+        """
+        host = urlparse(url).netloc
+        with self._rate_lock:
+            # monotonic: wall-clock adjustments can't stretch or skip the wait
+            now = time.monotonic()
+            last = self._last_request_time.get(host)
+            wait = 0.0 if last is None else last + self.rate_limit_seconds - now
+            self._last_request_time[host] = now + max(wait, 0.0)
+        if wait > 0:
+            time.sleep(wait)
 
     @abstractmethod
     def scan(self, source: dict) -> list[ScannedItem]:
@@ -72,14 +126,37 @@ class BaseScanner(ABC):
             logger.error("Scanner %s failed for %s: %s: %s", self.__class__.__name__, source.get("url"), error_type, e)
             return [], {"failure_type": failure_type, "error_message": f"{error_type}: {e}"}
 
+    def scan_many(self, sources: list[dict],
+                  max_workers=8) -> list[tuple[list[ScannedItem], dict | None]]:
+        """Run scan_safe over several sources concurrently.
+
+        Scanning is network-bound, so threads overlap the waits; the per-host
+        rate limit still applies across them.
+
+        Returns:
+            One (items, failure_info) tuple per source, in input order.
+        """
+        if not sources:
+            return []
+        workers = min(max_workers, len(sources))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.scan_safe, sources))
+
     @staticmethod
-    def is_recent(published_at: Optional[str], max_days=180) -> bool:
-        """Check if a publication date is within the recency window (default 6 months)."""
+    def is_recent(published_at: Optional[str], max_days=180,
+                  now: Optional[datetime] = None) -> bool:
+        """Check if a publication date is within the recency window (default 6 months).
+
+        ``now`` is a naive UTC datetime; pass one in when checking many entries.
+        """
         if not published_at:
             return False  # No date = skip it
         try:
             if isinstance(published_at, str):
-                dt = date_parser.parse(published_at, fuzzy=True)
+                try:
+                    dt = datetime.fromisoformat(published_at)
+                except ValueError:
+                    dt = date_parser.parse(published_at, fuzzy=True)
             else:
                 dt = published_at
 
@@ -87,7 +164,9 @@ class BaseScanner(ABC):
             if dt.tzinfo is not None:
                 dt = dt.replace(tzinfo=None)
 
-            age_days = (datetime.now(timezone.utc).replace(tzinfo=None) - dt).total_seconds() / 86400
+            if now is None:
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+            age_days = (now - dt).total_seconds() / 86400
             return age_days <= max_days
         except Exception:
             return False
@@ -1,12 +1,27 @@
+import calendar
+import html
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
 
 import feedparser
+import requests
 
-from .base_scanner import BaseScanner, ScannedItem
+from .base_scanner import BaseScanner, ScannedItem, read_capped
 
 logger = logging.getLogger(__name__)
 
+try:
+    from lxml import etree
+    from lxml.html import fragment_fromstring
+except ImportError:
+    fragment_fromstring = None
+
 # Nitter instances to try (rotate on failure)
 NITTER_INSTANCES = [
     "https://nitter.privacydev.net",
@@ -21,6 +36,24 @@ RSSHUB_INSTANCES = [
     "https://rsshub.rssforever.com",
 ]
 
+# Instances are probed concurrently; give up on the whole group after this
+PROBE_TIMEOUT_SECONDS = 15
+
+USER_AGENT = "LinkedInContentBot/1.0"
+
+# (connect, read): a bridge that doesn't answer quickly is usually down
+PROBE_REQUEST_TIMEOUT = (3, 10)
+
+# Bridge feeds hold a few dozen tweets; anything bigger is an error page or
+# junk, and only its start is handed to feedparser
+MAX_FEED_BYTES = 2_000_000
+
+# An instance that is down or erroring is left alone for this long
+FAILED_HOST_COOLDOWN_SECONDS = 300
+
+TAG_RE = re.compile(r"<[^>]+>")
+WHITESPACE_RE = re.compile(r"\s+")
+
 
 class TwitterScanner(BaseScanner):
     """Scanner for Twitter/X accounts via Nitter RSS or RSSHub."""
@@ -28,6 +61,12 @@ class TwitterScanner(BaseScanner):
     def __init__(self, max_hours=48, rate_limit_seconds=3.0):
         super().__init__(rate_limit_seconds=rate_limit_seconds)
         self.max_hours = max_hours
+        # url -> (etag, modified, feed) from the last full response, used to
+        # revalidate with a conditional GET and to answer a 304
+        self._feed_cache: dict[str, tuple] = {}
+        # host -> monotonic time before which it is not probed: set from
+        # Retry-After, or after a connection error or 5xx
+        self._skip_until: dict[str, float] = {}
 
     def scan(self, source: dict) -> list[ScannedItem]:
         handle = source.get("handle", "")
@@ -51,51 +90,120 @@ class TwitterScanner(BaseScanner):
         return []
 
     def _try_nitter(self, handle: str, source: dict) -> list[ScannedItem] | None:
-        for instance in NITTER_INSTANCES:
-            self._rate_limit()
-            url = f"{instance}/{handle}/rss"
-            try:
-                feed = feedparser.parse(url)
-                if feed.entries:
-                    return self._parse_feed(feed, handle, source)
-            except Exception as e:
-                logger.debug("Nitter instance %s failed for @%s: %s", instance, handle, e)
-                continue
-        return None
+        urls = [f"{instance}/{handle}/rss" for instance in NITTER_INSTANCES]
+        feed = self._first_feed(urls, "Nitter", handle)
+        return self._parse_feed(feed, handle, source) if feed else None
 
     def _try_rsshub(self, handle: str, source: dict) -> list[ScannedItem] | None:
-        for instance in RSSHUB_INSTANCES:
-            self._rate_limit()
-            url = f"{instance}/twitter/user/{handle}"
+        urls = [f"{instance}/twitter/user/{handle}" for instance in RSSHUB_INSTANCES]
+        feed = self._first_feed(urls, "RSSHub", handle)
+        return self._parse_feed(feed, handle, source) if feed else None
+
+    def _first_feed(self, urls: list[str], label: str, handle: str):
+        """Probe all instance URLs at once and return the first feed with entries.
+
+        Dead instances no longer cost a full timeout each before the next one
+        is tried. Rate limiting stays per host, so probes don't wait on each
+        other. Feeds seen before are revalidated with ETag/Last-Modified, and a
+        304 answers with the cached feed. Hosts that sent Retry-After on a 429
+        or 503 are skipped until it expires, and hosts that were unreachable
+        or returned a 5xx are skipped for FAILED_HOST_COOLDOWN_SECONDS.
+        Returns None if every probe fails or the group times out.
+        """
+        def probe(url):
+            host = urlparse(url).netloc
+            if self._skip_until.get(host, 0.0) > time.monotonic():
+                logger.debug("Skipping %s while it is cooling down", host)
+                return None
+            self._rate_limit(url)
+            etag, modified, cached_feed = self._feed_cache.get(url, (None, None, None))
+            headers = {"User-Agent": USER_AGENT}
+            if etag:
+                headers["If-None-Match"] = etag
+            if modified:
+                headers["If-Modified-Since"] = modified
             try:
-                feed = feedparser.parse(url)
-                if feed.entries:
-                    return self._parse_feed(feed, handle, source)
-            except Exception as e:
-                logger.debug("RSSHub instance %s failed for @%s: %s", instance, handle, e)
-                continue
+                resp = self._session.get(
+                    url, headers=headers, timeout=PROBE_REQUEST_TIMEOUT, stream=True,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                self._skip_until[host] = time.monotonic() + FAILED_HOST_COOLDOWN_SECONDS
+                raise
+            if resp.status_code == 304 and cached_feed is not None:
+                resp.close()
+                return cached_feed
+            delay = None
+            if resp.status_code in (429, 503):
+                delay = _retry_after_seconds(resp.headers.get("Retry-After"))
+            if delay is None and resp.status_code >= 500:
+                delay = FAILED_HOST_COOLDOWN_SECONDS
+            if delay:
+                self._skip_until[host] = time.monotonic() + delay
+            if not resp.ok:
+                resp.close()
+                resp.raise_for_status()
+            feed = feedparser.parse(
+                read_capped(resp, MAX_FEED_BYTES),
+                response_headers={k.lower(): v for k, v in resp.headers.items()},
+            )
+            if feed.entries:
+                self._feed_cache[url] = (
+                    resp.headers.get("ETag"), resp.headers.get("Last-Modified"), feed,
+                )
+            return feed
+
+        if not urls:
+            return None
+
+        executor = ThreadPoolExecutor(max_workers=len(urls))
+        futures = {executor.submit(probe, url): url for url in urls}
+        try:
+            for future in as_completed(futures, timeout=PROBE_TIMEOUT_SECONDS):
+                try:
+                    feed = future.result()
+                except Exception as e:
+                    logger.debug("%s instance %s failed for @%s: %s", label, futures[future], handle, e)
+                    continue
+                if feed is not None and feed.entries:
+                    return feed
+        except FuturesTimeoutError:
+            logger.debug("%s probes for @%s timed out after %ds", label, handle, PROBE_TIMEOUT_SECONDS)
+        finally:
+            # Don't wait on the slower probes once we have an answer
+            executor.shutdown(wait=False, cancel_futures=True)
         return None
 
     def _parse_feed(self, feed, handle: str, source: dict) -> list[ScannedItem]:
         items = []
+        # max_hours is a window in hours; is_recent() works in days, so
+        # compare epoch seconds against one cutoff for the whole feed
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        cutoff = time.time() - self.max_hours * 3600
         for entry in feed.entries:
             published_at = self._parse_date(entry)
-            if not self.is_recent(published_at, self.max_hours):
+            published_ts = self._parse_timestamp(entry)
+            if published_ts is not None:
+                if published_ts < cutoff:
+                    continue
+            elif not self.is_recent(published_at, self.max_hours / 24, now=now):
+                # Only a raw date string to go on
                 continue
 
-            link = entry.get("link", "")
             content = entry.get("title", "") or entry.get("summary", "")
             if not content:
                 continue
 
-            # Clean content
-            content = re.sub(r"<[^>]+>", " ", content)
-            content = re.sub(r"\s+", " ", content).strip()
+            # Skip plain retweets (no added commentary before "RT"). Checking
+            # the raw text first saves cleaning the obvious ones.
+            if content.startswith("RT @"):
+                continue
 
-            # Skip plain retweets (no added commentary before "RT")
+            # Clean content
+            content = _html_to_text(content)
             if content.startswith("RT @"):
                 continue
 
+            link = entry.get("link", "")
             items.append(ScannedItem(
                 url=link or f"https://twitter.com/{handle}",
                 title=f"@{handle}: {content[:100]}",
@@ -110,13 +218,52 @@ class TwitterScanner(BaseScanner):
 
     @staticmethod
     def _parse_date(entry) -> str | None:
-        from datetime import datetime
         for field in ("published_parsed", "updated_parsed"):
             parsed = entry.get(field)
             if parsed:
                 try:
-                    dt = datetime(*parsed[:6])
-                    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+                    return datetime(*parsed[:6]).isoformat(timespec="seconds")
                 except Exception:
                     continue
         return entry.get("published") or entry.get("updated")
+
+    @staticmethod
+    def _parse_timestamp(entry) -> float | None:
+        """UTC epoch seconds from feedparser's parsed date, if it has one."""
+        for field in ("published_parsed", "updated_parsed"):
+            parsed = entry.get(field)
+            if parsed:
+                return calendar.timegm(parsed[:6])
+        return None
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def _html_to_text(content: str) -> str:
+    """Strip tags, decode entities and collapse whitespace in entry text.
+
+    Uses lxml's parser when available and the tag regex otherwise. Either
+    way, tags act as word breaks.
+    """
+    if fragment_fromstring is not None:
+        try:
+            fragment = fragment_fromstring(content, create_parent="div")
+            return " ".join(" ".join(fragment.itertext()).split())
+        except (etree.ParserError, ValueError):
+            pass
+    return WHITESPACE_RE.sub(" ", html.unescape(TAG_RE.sub(" ", content))).strip()
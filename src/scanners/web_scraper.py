@@ -1,12 +1,44 @@
+import importlib.util
 import logging
 import re
 
 import requests
+from urllib3.util import Retry
 
-from .base_scanner import BaseScanner, ScannedItem
+from .base_scanner import BaseScanner, ScannedItem, read_capped
 
 logger = logging.getLogger(__name__)
 
+try:
+    import trafilatura
+except ImportError:
+    trafilatura = None
+
+try:
+    from bs4 import BeautifulSoup, SoupStrainer
+except ImportError:
+    BeautifulSoup = None
+
+# selectolax's lexbor parser is C end to end and much faster than bs4 for the
+# fallback extraction; bs4 is used when it isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# lxml's C parser is several times faster than the pure-Python html.parser;
+# bs4 loads it by name, so only check that it is installed
+BS4_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+MAX_CONTENT_CHARS = 5000
+# Pages are read in chunks and cut off here rather than loaded whole
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+WHITESPACE_RE = re.compile(r"\s+")
+
+# (connect, read)
+FETCH_TIMEOUT = (5, 15)
+
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; LinkedInContentBot/1.0; +research)"
 }
@@ -18,6 +50,9 @@ class WebScraper(BaseScanner):
     Uses trafilatura for content extraction with requests as transport.
     """
 
+    # One quick retry for dropped connections; pages are fetched once per run
+    http_retries = Retry(total=1, backoff_factor=0.2)
+
     def __init__(self, max_hours=48, rate_limit_seconds=3.0):
         super().__init__(rate_limit_seconds=rate_limit_seconds)
         self.max_hours = max_hours
@@ -25,23 +60,36 @@ class WebScraper(BaseScanner):
     def scan(self, source: dict) -> list[ScannedItem]:
         url = source["url"]
         logger.info("Web scraping: %s (%s)", source.get("name", url), url)
-        self._rate_limit()
+        self._rate_limit(url)
 
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=15)
-            resp.raise_for_status()
+            resp = self._session.get(url, headers=HEADERS, timeout=FETCH_TIMEOUT, stream=True)
+            if not resp.ok:
+                resp.close()
+                resp.raise_for_status()
+            # PDFs, JSON, images etc. would only waste a parse in each
+            # extractor; a missing Content-Type is still given a try
+            content_type = resp.headers.get("Content-Type", "").lower()
+            if content_type and "html" not in content_type and "xml" not in content_type:
+                resp.close()
+                logger.warning("Skipping %s: not an HTML page (%s)", url, content_type)
+                return []
+            # Left undecoded: the parsers below all detect the charset
+            # themselves, including from <meta> tags
+            html = read_capped(resp, MAX_RESPONSE_BYTES)
         except requests.RequestException as e:
             logger.warning("Failed to fetch %s: %s", url, e)
             return []
 
-        html = resp.text
-
         # Try trafilatura first for clean extraction
         content, title = self._extract_with_trafilatura(html, url)
 
-        # Fallback to basic BeautifulSoup extraction
+        # Fallback to basic tag-based extraction
         if not content:
-            content, title = self._extract_with_bs4(html)
+            if LexborHTMLParser is not None:
+                content, title = self._extract_with_selectolax(html)
+            else:
+                content, title = self._extract_with_bs4(html)
 
         if not content:
             logger.warning("No content extracted from %s", url)
@@ -50,49 +98,72 @@ class WebScraper(BaseScanner):
         return [ScannedItem(
             url=url,
             title=title or source.get("name", ""),
-            content=content[:5000],
+            content=content[:MAX_CONTENT_CHARS],
             author=source.get("name"),
             published_at=None,
             source_id=source.get("id"),
         )]
 
     @staticmethod
-    def _extract_with_trafilatura(html: str, url: str) -> tuple[str, str | None]:
+    def _extract_with_trafilatura(html: bytes | str, url: str) -> tuple[str, str | None]:
+        if trafilatura is None:
+            logger.debug("trafilatura not installed, using bs4 fallback")
+            return "", None
         try:
-            import trafilatura
-            # Extract text and metadata in a single call
-            result = trafilatura.extract(
+            # Text and metadata in one call, as Python objects rather than
+            # a JSON string that would have to be parsed back
+            result = trafilatura.bare_extraction(
                 html,
                 url=url,
                 include_comments=False,
                 include_tables=False,
                 favor_precision=True,
                 with_metadata=True,
-                output_format="json",
             )
             if result:
-                import json
-                try:
-                    data = json.loads(result)
-                    text = data.get("text") or data.get("raw_text", "")
-                    title = data.get("title")
-                    return text, title
-                except (json.JSONDecodeError, TypeError):
-                    # Fallback: treat result as plain text
-                    return result, None
-        except ImportError:
-            logger.debug("trafilatura not installed, using bs4 fallback")
+                # trafilatura 1.x returns a dict, 2.x a Document
+                if isinstance(result, dict):
+                    return result.get("text") or result.get("raw_text") or "", result.get("title")
+                text = getattr(result, "text", None) or getattr(result, "raw_text", None) or ""
+                return text, getattr(result, "title", None)
         except Exception as e:
             logger.debug("trafilatura extraction failed: %s", e)
         return "", None
 
     @staticmethod
-    def _extract_with_bs4(html: str) -> tuple[str, str | None]:
+    def _extract_with_selectolax(html: bytes | str) -> tuple[str, str | None]:
         try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, "html.parser")
+            tree = LexborHTMLParser(html, encoding=True)
+            for node in tree.css("script, style, nav, header, footer, aside"):
+                node.decompose()
 
-            # Remove scripts, styles, nav
+            title = None
+            title_node = tree.css_first("title")
+            if title_node is not None:
+                title = title_node.text(strip=True)
+
+            # Same root preference as the bs4 path
+            root = tree.css_first("article") or tree.css_first("main") or tree.body
+            if root is None:
+                return "", title
+            text = WHITESPACE_RE.sub(" ", root.text(separator=" ", strip=True)).strip()
+            return text, title
+        except Exception as e:
+            logger.debug("selectolax extraction failed: %s", e)
+        return "", None
+
+    @staticmethod
+    def _extract_with_bs4(html: bytes | str) -> tuple[str, str | None]:
+        if BeautifulSoup is None:
+            logger.debug("BeautifulSoup not installed")
+            return "", None
+        try:
+            # Only build the subtrees read below; <head> scripts, styles and
+            # meta tags are skipped by the parser entirely
+            strainer = SoupStrainer(["title", "article", "main", "body"])
+            soup = BeautifulSoup(html, BS4_PARSER, parse_only=strainer)
+
+            # Remove scripts, styles, nav nested inside the kept subtrees
             for tag in soup(["script", "style", "nav", "header", "footer", "aside"]):
                 tag.decompose()
 
@@ -101,20 +172,22 @@ class WebScraper(BaseScanner):
             if title_tag:
                 title = title_tag.get_text(strip=True)
 
-            # Try article tag first
-            article = soup.find("article")
-            if article:
-                text = article.get_text(separator=" ", strip=True)
-            else:
-                # Fall back to main or body
-                main = soup.find("main") or soup.find("body")
-                text = main.get_text(separator=" ", strip=True) if main else ""
-
-            # Clean whitespace
-            text = re.sub(r"\s+", " ", text).strip()
-            return text, title
-        except ImportError:
-            logger.debug("BeautifulSoup not installed")
+            # Try article tag first, then fall back to main or body
+            root = soup.find("article") or soup.find("main") or soup.find("body")
+            if root is None:
+                return "", title
+
+            # Same text as get_text(" ", strip=True) with whitespace collapsed,
+            # but stop walking the tree once the content cap is filled
+            parts = []
+            length = 0
+            for string in root.stripped_strings:
+                piece = WHITESPACE_RE.sub(" ", string)
+                parts.append(piece)
+                length += len(piece) + 1
+                if length >= MAX_CONTENT_CHARS:
+                    break
+            return " ".join(parts), title
         except Exception as e:
             logger.debug("BS4 extraction failed: %s", e)
         return "", None
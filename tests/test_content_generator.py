@@ -0,0 +1,15 @@
+import pytest
+
+from src.content_generator import _anti_cringe_filter
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Rates are up again.\n\nThoughts? Agree?", "Rates are up again."),
+    ("Rates are up again. Thoughts? Let that sink in.", "Rates are up again."),
+    ("Rates are up again.\n\nThoughts?", "Rates are up again."),
+    ("Thoughts? on this are welcome below.", "Thoughts? on this are welcome below."),
+    ("Read that again. Banks are slow.", "Banks are slow."),
+    ("A clean post with nothing to strip.", "A clean post with nothing to strip."),
+])
+def test_anti_cringe_filter(text, expected):
+    assert _anti_cringe_filter(text) == expected
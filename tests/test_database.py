@@ -0,0 +1,50 @@
+import sqlite3
+
+import pytest
+
+from src import database as db
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    path = str(tmp_path / "test.db")
+    monkeypatch.setenv("DATABASE_PATH", path)
+    db.init_db()
+    db.upsert_source("Source", "http://host/feed", "rss")
+    with db.get_connection() as conn:
+        source_id = conn.execute("SELECT id FROM sources").fetchone()[0]
+        conn.executemany(
+            "INSERT INTO scanned_content (source_id, url, title, content) VALUES (?, ?, ?, ?)",
+            [(source_id, f"http://host/{i}", f"Title {i}", "Body") for i in range(3)],
+        )
+    yield path
+    db.close_all_connections()
+
+
+def _committed_rejections(path):
+    other = sqlite3.connect(path)
+    try:
+        return [row[0] for row in other.execute("SELECT content_id FROM candidate_rejections")]
+    finally:
+        other.close()
+
+
+def test_writes_commit_while_candidate_pool_is_iterated(temp_db):
+    pool = db.iter_candidate_pool()
+    first = next(pool)
+
+    db.reject_candidate(first["id"])
+
+    assert _committed_rejections(temp_db) == [first["id"]]
+    with db.get_connection() as conn:
+        assert not conn.in_transaction
+    assert len(list(pool)) == 2
+
+
+def test_dropping_candidate_pool_iterator_keeps_writes(temp_db):
+    pool = db.iter_candidate_pool()
+    first = next(pool)
+    db.reject_candidate(first["id"])
+    del pool
+
+    assert _committed_rejections(temp_db) == [first["id"]]
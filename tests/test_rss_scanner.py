@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime
+
+from src.scanners.rss_scanner import RSSScanner
+
+
+class FakeResponse:
+    def __init__(self, url, content, headers=None, status_code=200):
+        self.url = url
+        self.content = content
+        self.headers = headers or {"Content-Type": "application/rss+xml"}
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    def __init__(self, response):
+        self.response = response
+
+    def get(self, url, **kwargs):
+        return self.response
+
+
+def _feed(link):
+    pub = format_datetime(datetime.now(timezone.utc))
+    return (
+        '<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+        f"<item><title>A post</title><link>{link}</link><pubDate>{pub}</pubDate>"
+        "<description>Body text</description></item></channel></rss>"
+    ).encode()
+
+
+def test_relative_links_resolve_against_feed_url():
+    scanner = RSSScanner(rate_limit_seconds=0)
+    scanner._session = FakeSession(FakeResponse("http://host/feed.xml", _feed("/posts/a")))
+
+    items = scanner.scan({"id": 1, "url": "http://host/feed.xml", "name": "Host"})
+
+    assert [item.url for item in items] == ["http://host/posts/a"]
+
+
+def test_absolute_links_are_left_alone():
+    scanner = RSSScanner(rate_limit_seconds=0)
+    scanner._session = FakeSession(
+        FakeResponse("http://host/feed.xml", _feed("https://other.example/p/1")),
+    )
+
+    items = scanner.scan({"id": 1, "url": "http://host/feed.xml", "name": "Host"})
+
+    assert [item.url for item in items] == ["https://other.example/p/1"]